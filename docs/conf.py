@@ -6,39 +6,66 @@ OpenColorIO Configuration for ACES - Documentation Configuration
 ================================================================
 """
 
-import opencolorio_config_aces as package
+import os
+from importlib.metadata import metadata
 
-basename = package.__name__.replace("_", "-")
+from sphinx.util import logging
+
+import opencolorio_config_aces
+
+metadata_package = metadata("opencolorio-config-aces")
+
+basename = metadata_package["Name"]
+project = metadata_package["Summary"]
+author = metadata_package["Author"]
+documentation_title = f"{project} Documentation"
 
 # -- General configuration ------------------------------------------------
 extensions = [
-    "sphinx.ext.autodoc",
+    "autoapi.extension",
     "sphinx.ext.intersphinx",
     "sphinx.ext.todo",
     "sphinx.ext.coverage",
     "sphinx.ext.ifconfig",
     "sphinx.ext.viewcode",
-    "sphinx.ext.autosummary",
     "sphinx.ext.napoleon",
     "sphinx.ext.mathjax",
 ]
 
-intersphinx_mapping = {"python": ("https://docs.python.org/3.8", None)}
+# NOTE: The inventory is generated before building the documentation by the
+# "update_intersphinx_inventory" task, a warning is emitted and the online
+# inventory is fetched if it has not been generated.
+intersphinx_inventory_python = os.path.join(
+    os.path.dirname(__file__), "_intersphinx", "python-objects.inv"
+)
+if not os.path.exists(intersphinx_inventory_python):
+    logging.getLogger(__name__).warning(
+        '"%s" inventory does not exist, the online inventory will be fetched, '
+        'please run the "update_intersphinx_inventory" task!',
+        intersphinx_inventory_python,
+    )
+    intersphinx_inventory_python = None
 
-autosummary_generate = True
+intersphinx_mapping = {
+    "python": ("https://docs.python.org/3.9", intersphinx_inventory_python)
+}
 
-autodoc_mock_imports = []
+intersphinx_cache_limit = 90
 
-autoclass_content = "both"
+autoapi_type = "python"
+autoapi_dirs = ["../opencolorio_config_aces"]
+autoapi_ignore = ["*/aces-dev/*", "*/tests/*"]
+autoapi_options = ["members", "undoc-members", "show-inheritance"]
+autoapi_python_class_content = "both"
+autoapi_add_toctree_entry = False
 
 templates_path = ["_templates"]
 source_suffix = ".rst"
 master_doc = "index"
 
-project = package.__application_name__
-copyright = package.__copyright__.replace("Copyright (C)", "")  # noqa: A001
-version = f"{package.__major_version__}.{package.__minor_version__}"
-release = package.__version__
+copyright = opencolorio_config_aces.__copyright__  # noqa: A001
+release = metadata_package["Version"]
+version = ".".join(release.split(".")[:2])
 
 exclude_patterns = ["_build"]
 
@@ -82,8 +109,8 @@ latex_documents = [
     (
         "index",
         f"{basename}.tex",
-        f"{package.__application_name__} Documentation",
-        package.__author__,
+        documentation_title,
+        author,
         "manual",
     ),
 ]
@@ -93,8 +120,8 @@ man_pages = [
     (
         "index",
         basename,
-        f"{package.__application_name__} Documentation",
-        [package.__author__],
+        documentation_title,
+        [author],
         1,
     )
 ]
@@ -104,16 +131,16 @@ texinfo_documents = [
     (
         "index",
         basename,
-        f"{package.__application_name__} Documentation",
-        package.__author__,
-        package.__application_name__,
+        documentation_title,
+        author,
+        project,
         basename,
         "Miscellaneous",
     ),
 ]
 # -- Options for Epub output ----------------------------------------------
-epub_title = package.__application_name__
-epub_author = package.__author__
-epub_publisher = package.__author__
-epub_copyright = package.__copyright__.replace("Copyright (C)", "")
+epub_title = project
+epub_author = author
+epub_publisher = author
+epub_copyright = copyright
 epub_exclude_files = ["search.html"]
@@ -20,53 +20,53 @@ Sub-packages
 -   utilities: Various utilities and data structures.
 """
 
-from .config import (
-    TRANSFORM_FACTORIES,
-    colorspace_factory,
-    group_transform_factory,
-    look_factory,
-    named_transform_factory,
-    produce_transform,
-    transform_factory,
-    view_transform_factory,
-)
-from .config import (
-    BUILTIN_TRANSFORMS,
-    ConfigData,
-    PROFILE_VERSION_DEFAULT,
-    PROFILE_VERSIONS,
-    deserialize_config_data,
-    generate_config,
-    serialize_config_data,
-    validate_config,
-)
-from .config import (
-    build_aces_conversion_graph,
-    classify_aces_ctl_transforms,
-    conversion_path,
-    ctl_transform_to_node,
-    discover_aces_ctl_transforms,
-    filter_ctl_transforms,
-    filter_nodes,
-    node_to_ctl_transform,
-    plot_aces_conversion_graph,
-    print_aces_taxonomy,
-    unclassify_ctl_transforms,
-    version_aces_dev,
-)
-from .config import (
-    DescriptionStyle,
-    generate_config_aces,
-)
-from .config import generate_config_cg, generate_config_studio
-from .clf import (
-    discover_clf_transforms,
-    classify_clf_transforms,
-    unclassify_clf_transforms,
-    filter_clf_transforms,
-    print_clf_taxonomy,
-)
-from .clf import generate_clf_transform
+import typing
+
+from opencolorio_config_aces.utilities import lazy_module_attributes
+
+if typing.TYPE_CHECKING:
+    from .config import (
+        TRANSFORM_FACTORIES,
+        colorspace_factory,
+        group_transform_factory,
+        look_factory,
+        named_transform_factory,
+        produce_transform,
+        transform_factory,
+        view_transform_factory,
+        BUILTIN_TRANSFORMS,
+        ConfigData,
+        PROFILE_VERSION_DEFAULT,
+        PROFILE_VERSIONS,
+        deserialize_config_data,
+        generate_config,
+        serialize_config_data,
+        validate_config,
+        build_aces_conversion_graph,
+        classify_aces_ctl_transforms,
+        conversion_path,
+        ctl_transform_to_node,
+        discover_aces_ctl_transforms,
+        filter_ctl_transforms,
+        filter_nodes,
+        node_to_ctl_transform,
+        plot_aces_conversion_graph,
+        print_aces_taxonomy,
+        unclassify_ctl_transforms,
+        version_aces_dev,
+        DescriptionStyle,
+        generate_config_aces,
+        generate_config_cg,
+        generate_config_studio,
+    )
+    from .clf import (
+        discover_clf_transforms,
+        classify_clf_transforms,
+        unclassify_clf_transforms,
+        filter_clf_transforms,
+        print_clf_taxonomy,
+        generate_clf_transform,
+    )
 
 __author__ = "OpenColorIO Contributors"
 __copyright__ = "Copyright Contributors to the OpenColorIO Project."
@@ -84,8 +84,6 @@ __all__ = [
     "produce_transform",
     "transform_factory",
     "view_transform_factory",
-]
-__all__ += [
     "BUILTIN_TRANSFORMS",
     "ConfigData",
     "PROFILE_VERSION_DEFAULT",
@@ -94,8 +92,6 @@ __all__ += [
     "generate_config",
     "serialize_config_data",
     "validate_config",
-]
-__all__ += [
     "build_aces_conversion_graph",
     "classify_aces_ctl_transforms",
     "conversion_path",
@@ -108,24 +104,71 @@ __all__ += [
     "print_aces_taxonomy",
     "unclassify_ctl_transforms",
     "version_aces_dev",
-]
-__all__ += [
     "DescriptionStyle",
     "generate_config_aces",
-]
-__all__ += ["generate_config_cg", "generate_config_studio"]
-__all__ += [
+    "generate_config_cg",
+    "generate_config_studio",
     "discover_clf_transforms",
     "classify_clf_transforms",
     "unclassify_clf_transforms",
     "filter_clf_transforms",
     "print_clf_taxonomy",
+    "generate_clf_transform",
 ]
-__all__ += ["generate_clf_transform"]
+
+_LAZY_IMPORTS = {
+    "TRANSFORM_FACTORIES": ".config",
+    "colorspace_factory": ".config",
+    "group_transform_factory": ".config",
+    "look_factory": ".config",
+    "named_transform_factory": ".config",
+    "produce_transform": ".config",
+    "transform_factory": ".config",
+    "view_transform_factory": ".config",
+    "BUILTIN_TRANSFORMS": ".config",
+    "ConfigData": ".config",
+    "PROFILE_VERSION_DEFAULT": ".config",
+    "PROFILE_VERSIONS": ".config",
+    "deserialize_config_data": ".config",
+    "generate_config": ".config",
+    "serialize_config_data": ".config",
+    "validate_config": ".config",
+    "build_aces_conversion_graph": ".config",
+    "classify_aces_ctl_transforms": ".config",
+    "conversion_path": ".config",
+    "ctl_transform_to_node": ".config",
+    "discover_aces_ctl_transforms": ".config",
+    "filter_ctl_transforms": ".config",
+    "filter_nodes": ".config",
+    "node_to_ctl_transform": ".config",
+    "plot_aces_conversion_graph": ".config",
+    "print_aces_taxonomy": ".config",
+    "unclassify_ctl_transforms": ".config",
+    "version_aces_dev": ".config",
+    "DescriptionStyle": ".config",
+    "generate_config_aces": ".config",
+    "generate_config_cg": ".config",
+    "generate_config_studio": ".config",
+    "discover_clf_transforms": ".clf",
+    "classify_clf_transforms": ".clf",
+    "unclassify_clf_transforms": ".clf",
+    "filter_clf_transforms": ".clf",
+    "print_clf_taxonomy": ".clf",
+    "generate_clf_transform": ".clf",
+}
+"""
+Mapping of the public objects to the sub-packages defining them, the objects
+are imported on first attribute access, see :pep:`562`.
+
+_LAZY_IMPORTS : dict
+"""
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, _LAZY_IMPORTS)
+
 
 __application_name__ = "OpenColorIO Configuration for ACES"
 
 __major_version__ = "2"
 __minor_version__ = "0"
 __change_version__ = "0"
-__version__ = ".".join((__major_version__, __minor_version__, __change_version__))
+__version__ = "2.0.0"
@@ -1,25 +1,31 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright Contributors to the OpenColorIO Project.
 
-from .discover import (
-    discover_clf_transforms,
-    classify_clf_transforms,
-    unclassify_clf_transforms,
-    filter_clf_transforms,
-    print_clf_taxonomy,
-)
-from .transforms import (
-    generate_clf_transform,
-    generate_clf_transforms_arri,
-    generate_clf_transforms_bmdfilm,
-    generate_clf_transforms_canon,
-    generate_clf_transforms_davinci,
-    generate_clf_transforms_itu,
-    generate_clf_transforms_ocio,
-    generate_clf_transforms_panasonic,
-    generate_clf_transforms_red,
-    generate_clf_transforms_sony,
-)
+import typing
+
+from opencolorio_config_aces.utilities import lazy_module_attributes
+
+if typing.TYPE_CHECKING:
+    from .discover import (
+        discover_clf_transforms,
+        classify_clf_transforms,
+        unclassify_clf_transforms,
+        filter_clf_transforms,
+        print_clf_taxonomy,
+    )
+    from .transforms import (
+        generate_clf_transform,
+        generate_clf_transforms_apple,
+        generate_clf_transforms_arri,
+        generate_clf_transforms_bmdfilm,
+        generate_clf_transforms_canon,
+        generate_clf_transforms_davinci,
+        generate_clf_transforms_itu,
+        generate_clf_transforms_ocio,
+        generate_clf_transforms_panasonic,
+        generate_clf_transforms_red,
+        generate_clf_transforms_sony,
+    )
 
 __all__ = [
     "discover_clf_transforms",
@@ -27,10 +33,8 @@ __all__ = [
     "unclassify_clf_transforms",
     "filter_clf_transforms",
     "print_clf_taxonomy",
-]
-__all__ += [
-    "generate_clf_transform",
     "generate_clf_transform",
+    "generate_clf_transforms_apple",
     "generate_clf_transforms_arri",
     "generate_clf_transforms_bmdfilm",
     "generate_clf_transforms_canon",
@@ -41,3 +45,30 @@ __all__ += [
     "generate_clf_transforms_red",
     "generate_clf_transforms_sony",
 ]
+
+_LAZY_IMPORTS = {
+    "discover_clf_transforms": ".discover",
+    "classify_clf_transforms": ".discover",
+    "unclassify_clf_transforms": ".discover",
+    "filter_clf_transforms": ".discover",
+    "print_clf_taxonomy": ".discover",
+    "generate_clf_transform": ".transforms",
+    "generate_clf_transforms_apple": ".transforms",
+    "generate_clf_transforms_arri": ".transforms",
+    "generate_clf_transforms_bmdfilm": ".transforms",
+    "generate_clf_transforms_canon": ".transforms",
+    "generate_clf_transforms_davinci": ".transforms",
+    "generate_clf_transforms_itu": ".transforms",
+    "generate_clf_transforms_ocio": ".transforms",
+    "generate_clf_transforms_panasonic": ".transforms",
+    "generate_clf_transforms_red": ".transforms",
+    "generate_clf_transforms_sony": ".transforms",
+}
+"""
+Mapping of the public objects to the sub-packages defining them, the objects
+are imported on first attribute access, see :pep:`562`.
+
+_LAZY_IMPORTS : dict
+"""
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, _LAZY_IMPORTS)
@@ -16,22 +16,25 @@ discovery and classification:
 
 from __future__ import annotations
 
+import copy
+import functools
 import itertools
 import logging
 import os
+import re
+import sys
 import xml.etree.ElementTree
 from collections import defaultdict
-from collections.abc import Mapping, Sequence
+from collections.abc import Collection, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable, cast
 
 from opencolorio_config_aces.config.reference.discover.classify import (
     ACESTransformID,
 )
 from opencolorio_config_aces.utilities import (
-    attest,
     message_box,
     paths_common_ancestor,
-    vivified_to_dict,
 )
 
 __author__ = "OpenColorIO Contributors"
@@ -90,11 +93,45 @@ urn:aswf:ocio:transformId:1.0:OCIO:ACES:AP0_to_AP1-Gamma2pnt2:1.0
 |-------------URN-----------|:|----------------ID---------------|
 """
 
+_PATTERN_CLF_TRANSFORM_ID: re.Pattern = re.compile(
+    rf"^{re.escape(URN_CLF + SEPARATOR_ID_CLF)}"
+    rf"(?P<namespace>[^{SEPARATOR_ID_CLF}]*){SEPARATOR_ID_CLF}"
+    rf"(?P<type>[^{SEPARATOR_ID_CLF}]*){SEPARATOR_ID_CLF}"
+    rf"(?P<name>[^{SEPARATOR_ID_CLF}]*){SEPARATOR_ID_CLF}"
+    rf"(?P<major_version>[^{SEPARATOR_ID_CLF}{re.escape(SEPARATOR_VERSION_CLF)}]*)"
+    rf"{re.escape(SEPARATOR_VERSION_CLF)}"
+    rf"(?P<minor_version>[^{SEPARATOR_ID_CLF}{re.escape(SEPARATOR_VERSION_CLF)}]*)$"
+)
+"""
+Compiled pattern tokenizing a *CLFtransformID* in a single pass.
+"""
+
 EXTENSION_CLF: str = ".clf"
 """
 *CLF* transform extension.
 """
 
+_SUFFIXES_CLF: tuple = tuple(
+    sorted(
+        {
+            "".join(characters)
+            for characters in itertools.product(
+                *((character.lower(), character.upper()) for character in EXTENSION_CLF)
+            )
+        }
+    )
+)
+"""
+*CLF* transform extension in every letter case combination so that files can
+be matched case-insensitively with :meth:`str.endswith`.
+"""
+
+_THRESHOLD_PARSING_CONCURRENT_CLF: int = 16
+"""
+Number of *CLF* transforms from which they are parsed concurrently, a thread
+pool does not pay for itself below it.
+"""
+
 NAMESPACE_CLF: str = "OCIO"
 """
 Namespace for the *OCIO* *CLF* transforms.
@@ -126,7 +163,7 @@ PATTERNS_DESCRIPTION_CLF: dict = {}
 *CLF* transform description substitution patterns.
 """
 
-ROOT_TRANSFORMS_CLF: str = os.path.normpath(
+ROOT_TRANSFORMS_CLF: str = os.path.abspath(
     os.environ.get(
         "OPENCOLORIO_CONFIG_ACES__CLF_TRANSFORMS_ROOT",
         os.path.join(os.path.dirname(__file__), "..", "transforms"),
@@ -160,7 +197,7 @@ def clf_transform_relative_path(
          *CLF* transform relative path.
     """
 
-    return path.replace(f"{root_directory}{os.sep}", "")
+    return path.removeprefix(f"{root_directory}{os.sep}")
 
 
 class CLFTransformID:
@@ -193,6 +230,19 @@ class CLFTransformID:
     __repr__
     """
 
+    __slots__ = (
+        "_clf_transform_id",
+        "_urn",
+        "_type",
+        "_namespace",
+        "_name",
+        "_major_version",
+        "_minor_version",
+        "_patch_version",
+        "_source",
+        "_target",
+    )
+
     def __init__(self, clf_transform_id: str) -> None:
         self._clf_transform_id: str = clf_transform_id
 
@@ -413,39 +463,70 @@ class CLFTransformID:
 
         clf_transform_id = self._clf_transform_id
 
-        attest(
-            clf_transform_id.startswith(URN_CLF),
-            f"{self._clf_transform_id} URN {self._urn} is invalid!",
-        )
+        # NOTE: The error messages are only formatted on failure, contrary to
+        # the "attest" definition arguments which are formatted for every
+        # parsed *CLFtransformID*.
+        if not clf_transform_id.startswith(URN_CLF):
+            raise AssertionError(
+                f"{clf_transform_id} URN {clf_transform_id[: len(URN_CLF)]} "
+                f"is invalid!"
+            )
 
-        self._urn = clf_transform_id[: len(URN_CLF) + 1]
-        components = clf_transform_id[len(URN_CLF) + 1 :]
-        components = components.split(SEPARATOR_ID_CLF)
+        match = _PATTERN_CLF_TRANSFORM_ID.match(clf_transform_id)
 
-        attest(
-            (len(components) == 4),
-            f'{self._clf_transform_id} is an invalid "CLFtransformID"!',
-        )
+        if match is None:
+            raise AssertionError(f'{clf_transform_id} is an invalid "CLFtransformID"!')
 
-        self._namespace, self._type, self._name, version = components
+        (
+            namespace,
+            type_,
+            self._name,
+            self._major_version,
+            self._minor_version,
+        ) = match.groups()
 
-        attest(
-            (self._type in TRANSFORM_TYPES_CLF),
-            f"{self._clf_transform_id} type {self._type} is invalid!",
-        )
+        # NOTE: The *URN*, namespaces and types are shared by many
+        # *CLFtransformID*, they are interned so that they are stored once.
+        self._urn = sys.intern(clf_transform_id[: len(URN_CLF) + 1])
+        self._namespace = sys.intern(namespace)
+        self._type = sys.intern(type_)
 
-        if self._name is not None:
-            self._source, self._target = self._name.split("_to_")
+        if self._type not in TRANSFORM_TYPES_CLF:
+            raise AssertionError(f"{clf_transform_id} type {self._type} is invalid!")
 
-        attest(
-            version.count(SEPARATOR_VERSION_CLF) == 1,
-            f'{self._clf_transform_id} has an invalid "CLFtransformID" version!',
-        )
+        self._source, separator, self._target = self._name.partition("_to_")
 
-        (
-            self._major_version,
-            self._minor_version,
-        ) = version.split(SEPARATOR_VERSION_CLF)
+        if not separator:
+            raise AssertionError(
+                f'{clf_transform_id} has an invalid "CLFtransformID" name!'
+            )
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_clf_transform_id(clf_transform_id: str) -> CLFTransformID:
+    """
+    Return the :class:`opencolorio_config_aces.clf.CLFTransformID` class
+    instance for given *CLFtransformID*, caching it for subsequent calls.
+
+    Parameters
+    ----------
+    clf_transform_id
+        *CLFtransformID*, e.g.,
+        *urn:aswf:ocio:transformId:1.0:OCIO:ACES:AP0_to_AP1-Gamma2pnt2:1.0*.
+
+    Returns
+    -------
+    :class:`opencolorio_config_aces.clf.CLFTransformID`
+        *CLFtransformID*.
+
+    Notes
+    -----
+    -   The :class:`opencolorio_config_aces.clf.CLFTransformID` class instances
+        are read only and can thus be shared, repeatedly classifying the *CLF*
+        transforms in the same process reuses them.
+    """
+
+    return CLFTransformID(clf_transform_id)
 
 
 class CLFTransform:
@@ -463,6 +544,9 @@ class CLFTransform:
         *CLF* transform genus, e.g., *undefined*
     siblings
         *CLF* transform siblings, e.g., inverse transform.
+    eager
+        Whether to parse the *CLF* transform file on instantiation, otherwise
+        it is parsed on first access to an attribute requiring it.
 
     Attributes
     ----------
@@ -483,19 +567,66 @@ class CLFTransform:
     __repr__
     __eq__
     __ne__
+
+    Examples
+    --------
+    >>> import copy
+    >>> import pickle
+    >>> path = os.path.join(
+    ...     ROOT_TRANSFORMS_CLF, "sony", "input", "Sony.Input.SLog3-Curve.clf"
+    ... )
+    >>> clf_transform = CLFTransform(path, eager=False)
+    >>> clf_transform._parsed
+    False
+    >>> copy.copy(clf_transform) == clf_transform
+    True
+    >>> pickle.loads(pickle.dumps(clf_transform)).user_name
+    'S-Log3 Log to Linear Curve'
+    >>> clf_transform._parsed
+    False
+    >>> clf_transform.user_name
+    'S-Log3 Log to Linear Curve'
+    >>> clf_transform._parsed
+    True
+    >>> clf_transform.namespace
+    'Sony'
+    >>> copy.deepcopy(clf_transform).namespace
+    'Sony'
+    >>> clf_transform.undefined
+    Traceback (most recent call last):
+      ...
+    AttributeError: 'CLFTransform' object has no attribute 'undefined'
     """
 
+    __slots__ = (
+        "_parsed",
+        "_path",
+        "_code",
+        "_clf_transform_id",
+        "_user_name",
+        "_description",
+        "_input_descriptor",
+        "_output_descriptor",
+        "_information",
+        "_family",
+        "_genus",
+        "_siblings",
+    )
+
     def __init__(
         self,
         path: str,
         family: str | None = None,
         genus: str | None = None,
         siblings: Sequence | None = None,
+        eager: bool = True,
     ) -> None:
         if siblings is None:
             siblings = []
 
-        self._path: str = os.path.abspath(os.path.normpath(path))
+        self._parsed: bool = False
+
+        self._path: str = os.path.abspath(path)
 
         self._code: str | None = None
         self._clf_transform_id: CLFTransformID | None = None
@@ -509,7 +640,8 @@ class CLFTransform:
         self._genus: str | None = genus
         self._siblings: Sequence | None = siblings
 
-        self._parse()
+        if eager:
+            self._ensure_parsed()
 
     @property
     def path(self) -> str | None:
@@ -563,6 +695,8 @@ class CLFTransform:
         -   This property is read only.
         """
 
+        self._ensure_parsed()
+
         return self._clf_transform_id
 
     @property
@@ -580,6 +714,8 @@ class CLFTransform:
         -   This property is read only.
         """
 
+        self._ensure_parsed()
+
         return self._user_name
 
     @property
@@ -598,6 +734,8 @@ class CLFTransform:
         -   This property is read only.
         """
 
+        self._ensure_parsed()
+
         return self._description
 
     @property
@@ -616,6 +754,8 @@ class CLFTransform:
         -   This property is read only.
         """
 
+        self._ensure_parsed()
+
         return self._input_descriptor
 
     @property
@@ -634,6 +774,8 @@ class CLFTransform:
         -   This property is read only.
         """
 
+        self._ensure_parsed()
+
         return self._output_descriptor
 
     @property
@@ -652,6 +794,8 @@ class CLFTransform:
         -   This property is read only.
         """
 
+        self._ensure_parsed()
+
         return self._information
 
     @property
@@ -727,9 +871,26 @@ CLFTransform` class are tried on the underlying
              Attribute value.
         """
 
-        clf_transform_id = object.__getattribute__(self, "_clf_transform_id")
+        message = f"{type(self).__name__!r} object has no attribute {item!r}"
+
+        # NOTE: The private and special attributes are never forwarded: They
+        # are notably looked up by "copy" and "pickle" on instances whose slots
+        # are not set yet, parsing would then recurse into this method. Such
+        # instances cannot be parsed and do not forward any attribute.
+        if item.startswith("_"):
+            raise AttributeError(message)
 
-        return getattr(clf_transform_id, item)
+        try:
+            object.__getattribute__(self, "_parsed")
+        except AttributeError:
+            raise AttributeError(message) from None
+
+        self._ensure_parsed()
+
+        try:
+            return getattr(self._clf_transform_id, item)
+        except AttributeError:
+            raise AttributeError(message) from None
 
     def __str__(self) -> str:
         """
@@ -775,6 +936,8 @@ CLFTransform` class are tried on the underlying
 
         if not isinstance(other, CLFTransform):
             return False
+        elif self is other:
+            return True
         else:
             return self._path == other.path
 
@@ -796,40 +959,66 @@ CLFTransform` class are tried on the underlying
 
         return not (self == other)
 
+    def _ensure_parsed(self) -> None:
+        """Parse the *CLF* transform if it has not been parsed yet."""
+
+        if not object.__getattribute__(self, "_parsed"):
+            self._parse()
+            self._parsed = True
+
     def _parse(self) -> None:
         """Parse the *CLF* transform."""
 
-        tree = xml.etree.ElementTree.parse(self._path)  # noqa: S314
-        root = tree.getroot()
+        # NOTE: The header elements precede the process nodes, the parsing
+        # stops at the first process node so that the potentially large *LUT*
+        # arrays are not read. It also stops as soon as all the header elements
+        # have been read, e.g., when the "Info" element is the last one.
+        header_tags = ("Description", "InputDescriptor", "OutputDescriptor", "Info")
+        header = {}
+        with open(self._path, "rb") as clf_file:
+            elements = xml.etree.ElementTree.iterparse(  # noqa: S314
+                clf_file, events=("start", "end")
+            )
 
-        self._clf_transform_id = CLFTransformID(root.attrib["id"])
+            _event, root = next(elements)
+
+            depth = 1
+            for event, element in elements:
+                if event == "start":
+                    depth += 1
+                    if depth == 2 and element.tag not in header_tags:
+                        break
+                else:
+                    depth -= 1
+                    if depth == 1:
+                        header.setdefault(element.tag, element)
+                        if len(header) == len(header_tags):
+                            break
+
+        self._clf_transform_id = _cached_clf_transform_id(root.attrib["id"])
         self._user_name = root.attrib["name"]
 
-        description = next(iter(root.findall("./Description")), None)
+        description = header.get("Description")
         if description is not None:
             self._description = description.text
 
-        input_descriptor = next(iter(root.findall("./InputDescriptor")), None)
+        input_descriptor = header.get("InputDescriptor")
         if input_descriptor is not None:
             self._input_descriptor = input_descriptor.text
 
-        output_descriptor = next(iter(root.findall("./OutputDescriptor")), None)
+        output_descriptor = header.get("OutputDescriptor")
         if output_descriptor is not None:
             self._output_descriptor = output_descriptor.text
 
-        information = next(iter(root.findall("./Info")), None)
+        information = header.get("Info")
         if information is not None:
-            aces_transform_id = next(
-                iter(information.findall("./ACEStransformID")), None
-            )
+            aces_transform_id = information.find("ACEStransformID")
             if aces_transform_id is not None:
                 self._information["ACEStransformID"] = ACESTransformID(
                     aces_transform_id.text
                 )
 
-            builtin_transform = next(
-                iter(information.findall("./BuiltinTransform")), None
-            )
+            builtin_transform = information.find("BuiltinTransform")
             if builtin_transform is not None:
                 self._information["BuiltinTransform"] = builtin_transform.text
 
@@ -860,6 +1049,11 @@ class CLFTransformPair:
     __ne__
     """
 
+    __slots__ = (
+        "_forward_transform",
+        "_inverse_transform",
+    )
+
     def __init__(
         self, forward_transform: CLFTransform, inverse_transform: CLFTransform
     ) -> None:
@@ -912,8 +1106,8 @@ class CLFTransformPair:
 
         return (
             f"{self.__class__.__name__}("
-            f"{self._forward_transform!s}', "
-            f"{self._inverse_transform!s}')"
+            f"{self._forward_transform!s}, "
+            f"{self._inverse_transform!s})"
         )
 
     def __repr__(self) -> str:
@@ -946,6 +1140,8 @@ class CLFTransformPair:
 
         if not isinstance(other, CLFTransformPair):
             return False
+        elif self is other:
+            return True
         else:
             return (self._forward_transform == other._forward_transform) and (
                 self._inverse_transform == other._inverse_transform
@@ -986,36 +1182,50 @@ def find_clf_transform_pairs(
     -------
     :class:`defaultdict`
         Pairs of *CLF* transform paths.
-    """
 
-    def stem(path: str) -> str:
-        """Return the stem of given path."""
-
-        return os.path.splitext(os.path.basename(path))[0]
+    Examples
+    --------
+    >>> clf_transform_pairs = find_clf_transform_pairs(
+    ...     [
+    ...         "A_to_B.clf",
+    ...         "B_to_A.clf",
+    ...         "C-Curve.clf",
+    ...         "C-Curve_to_.clf",
+    ...         "_to_C-Curve.clf",
+    ...     ]
+    ... )
+    >>> for basename, pairs in sorted(clf_transform_pairs.items()):
+    ...     print(basename, sorted(pairs.values()))
+    A_to_B ['A_to_B.clf', 'B_to_A.clf']
+    C-Curve ['C-Curve.clf']
+    C-Curve_to_ ['C-Curve_to_.clf', '_to_C-Curve.clf']
+    """
 
     # NOTE: We are currently relying on the ordered "CLF" transform basenames
     # to define which transform is the forward transform.
+    stems = sorted(
+        (
+            (os.path.splitext(os.path.basename(clf_transform))[0], clf_transform)
+            for clf_transform in clf_transforms
+        ),
+        key=lambda x: x[0],
+    )
+
     paths = defaultdict(list)
-    for clf_transform in sorted(clf_transforms, key=stem):
-        forward_path = tuple(stem(clf_transform).split("_to_", 1))
-        inverse_path = tuple(reversed(forward_path))
-        if inverse_path in paths:
-            paths[inverse_path].append(clf_transform)
-        else:
-            paths[forward_path].append(clf_transform)
+    basenames = {}
+    for stem, clf_transform in stems:
+        # NOTE: A forward transform and its inverse share the same canonical
+        # key, i.e., their sorted source and target.
+        path = tuple(sorted(stem.split("_to_", 1)))
+        paths[path].append(clf_transform)
+        basenames.setdefault(path, stem)
 
     clf_transform_pairs = defaultdict(dict)
-    for clf_transforms in paths.values():
-        basename = stem(clf_transforms[0])
+    for path, clf_transforms in paths.items():
+        basename = basenames[path]
         clf_transform_pairs[basename]["forward_transform"] = clf_transforms[0]
         if len(clf_transforms) > 1:
             clf_transform_pairs[basename]["inverse_transform"] = clf_transforms[1]
-            clf_transform_pairs[basename]["forward_transform"].siblings.append(
-                clf_transform_pairs[basename]["inverse_transform"]
-            )
-            clf_transform_pairs[basename]["inverse_transform"].siblings.append(
-                clf_transform_pairs[basename]["forward_transform"]
-            )
 
     return clf_transform_pairs
 
@@ -1035,7 +1245,9 @@ def discover_clf_transforms(
     Returns
     -------
     :class:`defaultdict`
-        Discovered *CLF* transform paths.
+        Discovered *CLF* transform paths, the directories are traversed
+        depth-first in sorted order and the paths of each directory are
+        sorted.
 
     Examples
     --------
@@ -1048,25 +1260,49 @@ def discover_clf_transforms(
 'Apple.Input.Apple_Log_to_ACES2065-1.clf']
     """
 
-    root_directory = os.path.normpath(os.path.expandvars(root_directory))
+    root_directory = os.path.abspath(os.path.expandvars(root_directory))
 
+    # NOTE: The directories are traversed top-down with "os.scandir" as with
+    # "os.walk" but without listing the sub-directories and filenames first.
     clf_transforms = defaultdict(list)
-    for directory, _sub_directories, filenames in os.walk(root_directory):
-        if not filenames:
+    directories = [root_directory]
+    while directories:
+        directory = directories.pop()
+
+        try:
+            entries = os.scandir(directory)
+        except OSError:
             continue
 
-        for filename in filenames:
-            if not filename.lower().endswith(EXTENSION_CLF):
-                continue
+        sub_directories, directory_clf_transforms = [], []
+        with entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        sub_directories.append(entry.path)
 
-            clf_transform = os.path.join(directory, filename)
+                    continue
 
-            logger.debug(
-                '"%s" CLF transform was found!',
-                clf_transform_relative_path(clf_transform),
-            )
+                if not entry.name.endswith(_SUFFIXES_CLF):
+                    continue
+
+                clf_transform = entry.path
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        '"%s" CLF transform was found!',
+                        clf_transform_relative_path(clf_transform),
+                    )
+
+                directory_clf_transforms.append(clf_transform)
 
-            clf_transforms[directory].append(clf_transform)
+        # NOTE: "os.scandir" yields the entries in arbitrary order, they are
+        # sorted so that the discovery, and thus the classification, order is
+        # deterministic across platforms and runs.
+        if directory_clf_transforms:
+            clf_transforms[directory] = sorted(directory_clf_transforms)
+
+        directories.extend(sorted(sub_directories, reverse=True))
 
     return clf_transforms
 
@@ -1076,8 +1312,38 @@ TypeClassifiedCLFTransforms = dict[
 ]
 
 
+def _classify_sub_directory(sub_directory: str) -> tuple[str, str]:
+    """
+    Return the *CLF* transform family and genus for given sub-directory.
+
+    Parameters
+    ----------
+    sub_directory
+        Sub-directory, relative to the *CLF* transforms root directory.
+
+    Returns
+    -------
+    :class:`tuple`
+        *CLF* transform family and genus.
+    """
+
+    family, *genus = (
+        TRANSFORM_FAMILIES_CLF.get(part, part) for part in sub_directory.split(os.sep)
+    )
+
+    # NOTE: The families and genera are shared by many *CLF* transforms and
+    # used as dictionary keys, they are interned so that they are stored once
+    # and compared by identity.
+    return (
+        sys.intern(family),
+        sys.intern(TRANSFORM_GENUS_DEFAULT_CLF if not genus else "/".join(genus)),
+    )
+
+
 def classify_clf_transforms(
     unclassified_clf_transforms: defaultdict[str, list[str]],
+    families: Collection[str] | None = None,
+    max_workers: int | None = None,
 ) -> TypeClassifiedCLFTransforms:
     """
     Classify given *CLF* transforms.
@@ -1087,6 +1353,15 @@ def classify_clf_transforms(
     unclassified_clf_transforms
         Unclassified *CLF* transforms as returned by
         :func:`opencolorio_config_aces.discover_clf_transforms` definition.
+    families
+        *CLF* transform families to classify, e.g., ``{"blackmagic"}``, the
+        *CLF* transforms of the other families are skipped before being
+        parsed. All the families are classified if not given.
+    max_workers
+        Maximum number of threads used to parse the *CLF* transforms, defaults
+        to the number of processors plus four, bounded by the number of *CLF*
+        transforms. The *CLF* transforms are parsed serially if it is 1 or if
+        there are fewer than 16 of them.
 
     Returns
     -------
@@ -1113,58 +1388,126 @@ CLFTransform(\
 'apple...input...Apple.Input.Apple_Log_to_ACES2065-1.clf'))]
     """
 
-    classified_clf_transforms = defaultdict(lambda: defaultdict(dict))
+    classified_clf_transforms: TypeClassifiedCLFTransforms = {}
 
-    root_directory = paths_common_ancestor(
-        *itertools.chain.from_iterable(unclassified_clf_transforms.values())
-    )
+    clf_transform_pairs = []
+    # NOTE: The common ancestor of the directories is the common ancestor of
+    # the *CLF* transforms they contain, there is one directory per group of
+    # transforms thus fewer paths to compare.
+    root_directory = paths_common_ancestor(*unclassified_clf_transforms.keys())
     for directory, clf_transforms in unclassified_clf_transforms.items():
         if directory == root_directory:
             sub_directory = os.path.basename(root_directory)
         else:
-            sub_directory = directory.replace(f"{root_directory}{os.sep}", "")
+            sub_directory = clf_transform_relative_path(directory, root_directory)
 
-        family, *genus = (
-            TRANSFORM_FAMILIES_CLF.get(part, part)
-            for part in sub_directory.split(os.sep)
+        family, genus = _classify_sub_directory(sub_directory)
+
+        # NOTE: The family is derived from the directory, the *CLF* transforms
+        # of the excluded families can thus be skipped without being parsed.
+        if families is not None and family not in families:
+            continue
+
+        clf_transform_pairs.extend(
+            (family, genus, basename, pairs)
+            for basename, pairs in find_clf_transform_pairs(clf_transforms).items()
         )
 
-        genus = TRANSFORM_GENUS_DEFAULT_CLF if not genus else "/".join(genus)
+    if not clf_transform_pairs:
+        return classified_clf_transforms
 
-        for basename, pairs in find_clf_transform_pairs(clf_transforms).items():
-            if len(pairs) == 1:
-                clf_transform = CLFTransform(
-                    cast(str, next(iter(pairs.values()))),
-                    family,
-                    genus,
-                )
+    paths, path_families, genera = zip(
+        *(
+            (cast(str, path), family, genus)
+            for family, genus, _basename, pairs in clf_transform_pairs
+            for path in pairs.values()
+        )
+    )
 
-                logger.debug('Classifying "%s" under "%s".', clf_transform, genus)
+    if max_workers is None:
+        max_workers = min(len(paths), (os.cpu_count() or 1) + 4)
 
-                classified_clf_transforms[family][genus][basename] = clf_transform
+    # NOTE: Parsing the *CLF* transforms is mostly bound by reading the files,
+    # they are thus parsed concurrently unless there are too few of them for
+    # the thread pool to pay for itself.
+    if max_workers <= 1 or len(paths) < _THRESHOLD_PARSING_CONCURRENT_CLF:
+        parsed_clf_transforms = dict(
+            zip(paths, map(CLFTransform, paths, path_families, genera))
+        )
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            parsed_clf_transforms = dict(
+                zip(paths, executor.map(CLFTransform, paths, path_families, genera))
+            )
 
-            elif len(pairs) == 2:
-                forward_clf_transform = CLFTransform(
-                    cast(str, pairs["forward_transform"]), family, genus
-                )
-                inverse_clf_transform = CLFTransform(
-                    cast(str, pairs["inverse_transform"]), family, genus
-                )
+    for family, genus, basename, pairs in clf_transform_pairs:
+        genus_clf_transforms = classified_clf_transforms.setdefault(
+            family, {}
+        ).setdefault(genus, {})
 
-                clf_transform = CLFTransformPair(
-                    forward_clf_transform, inverse_clf_transform
-                )
+        if len(pairs) == 1:
+            clf_transform = parsed_clf_transforms[cast(str, next(iter(pairs.values())))]
+
+            logger.debug('Classifying "%s" under "%s".', clf_transform, genus)
+
+            genus_clf_transforms[basename] = clf_transform
 
-                logger.debug('Classifying "%s" under "%s".', clf_transform, genus)
+        elif len(pairs) == 2:
+            forward_clf_transform = parsed_clf_transforms[
+                cast(str, pairs["forward_transform"])
+            ]
+            inverse_clf_transform = parsed_clf_transforms[
+                cast(str, pairs["inverse_transform"])
+            ]
+
+            forward_clf_transform.siblings.append(inverse_clf_transform)
+            inverse_clf_transform.siblings.append(forward_clf_transform)
+
+            clf_transform = CLFTransformPair(
+                forward_clf_transform, inverse_clf_transform
+            )
 
-                classified_clf_transforms[family][genus][basename] = clf_transform
+            logger.debug('Classifying "%s" under "%s".', clf_transform, genus)
 
-    return vivified_to_dict(classified_clf_transforms)
+            genus_clf_transforms[basename] = clf_transform
+
+    return classified_clf_transforms
 
 
 TypeUnclassifiedCLFTransforms = list[CLFTransform]
 
 
+def _iter_unclassified_clf_transforms(
+    classified_clf_transforms: TypeClassifiedCLFTransforms,
+) -> Iterator[CLFTransform]:
+    """
+    Iterate over given classified *CLF* transforms, yielding both transforms of
+    the *CLF* transform pairs.
+
+    Parameters
+    ----------
+    classified_clf_transforms
+        Classified *CLF* transforms as returned by
+        :func:`opencolorio_config_aces.classify_clf_transforms` definition.
+
+    Yields
+    ------
+    :class:`CLFTransform`
+        Unclassified *CLF* transform.
+    """
+
+    for clf_transform in itertools.chain.from_iterable(
+        clf_transforms.values()
+        for genera in classified_clf_transforms.values()
+        for clf_transforms in genera.values()
+    ):
+        if isinstance(clf_transform, CLFTransform):
+            yield clf_transform
+        elif isinstance(clf_transform, CLFTransformPair):
+            yield clf_transform.forward_transform
+            yield clf_transform.inverse_transform
+
+
 def unclassify_clf_transforms(
     classified_clf_transforms: TypeClassifiedCLFTransforms,
 ) -> TypeUnclassifiedCLFTransforms:
@@ -1191,22 +1534,14 @@ def unclassify_clf_transforms(
     CLFTransform('apple...input...Apple.Input.Apple_Log-Curve.clf')
     """
 
-    unclassified_clf_transforms = []
-    for genera in classified_clf_transforms.values():
-        for clf_transforms in genera.values():
-            for clf_transform in clf_transforms.values():
-                if isinstance(clf_transform, CLFTransform):
-                    unclassified_clf_transforms.append(clf_transform)
-                elif isinstance(clf_transform, CLFTransformPair):
-                    unclassified_clf_transforms.append(clf_transform.forward_transform)
-                    unclassified_clf_transforms.append(clf_transform.inverse_transform)
-
-    return unclassified_clf_transforms
+    return list(_iter_unclassified_clf_transforms(classified_clf_transforms))
 
 
 def filter_clf_transforms(
     clf_transforms: TypeClassifiedCLFTransforms | TypeUnclassifiedCLFTransforms,
     filterers: Sequence[Callable] | None = None,
+    limit: int | None = None,
+    families: Collection[str] | None = None,
 ) -> list[CLFTransform]:
     """
     Filter given *CLF* transforms with given filterers.
@@ -1221,7 +1556,16 @@ def filter_clf_transforms(
     filterers
         List of callables used to filter the *CLF* transforms, each callable
         takes a *CLF* transform as argument and returns whether to include or
-        exclude the *CLF* transform as a bool.
+        exclude the *CLF* transform as a bool. The callables are evaluated in
+        the given order and the evaluation stops at the first exclusion, the
+        cheapest ones should thus be given first.
+    limit
+        Maximum number of *CLF* transforms to return, the filtering stops
+        once it is reached.
+    families
+        *CLF* transform families to include, e.g., ``{"blackmagic"}``, the
+        classified *CLF* transforms of the other families are skipped without
+        being visited. All the families are included if not given.
 
     Returns
     -------
@@ -1250,18 +1594,128 @@ def filter_clf_transforms(
         filterers = TRANSFORM_FILTERERS_DEFAULT_CLF
 
     if isinstance(clf_transforms, Mapping):
-        clf_transforms = unclassify_clf_transforms(clf_transforms)
+        if families is not None:
+            clf_transforms = {
+                family: genera
+                for family, genera in clf_transforms.items()
+                if family in families
+            }
+
+        clf_transforms = _iter_unclassified_clf_transforms(clf_transforms)
+    elif families is not None:
+        clf_transforms = (
+            clf_transform
+            for clf_transform in clf_transforms
+            if clf_transform.family in families
+        )
+
+    filterers = tuple(filterers)
+
+    # NOTE: The default filterers are empty, the transforms are then returned
+    # without evaluating a predicate per transform.
+    if not filterers:
+        filtered_clf_transforms = iter(clf_transforms)
+    elif len(filterers) == 1:
+        filterer = filterers[0]
+
+        filtered_clf_transforms = (
+            clf_transform for clf_transform in clf_transforms if filterer(clf_transform)
+        )
+    else:
+        filtered_clf_transforms = (
+            clf_transform
+            for clf_transform in clf_transforms
+            if all(filterer(clf_transform) for filterer in filterers)
+        )
+
+    return list(itertools.islice(filtered_clf_transforms, limit))
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_classified_builtin_clf_transforms() -> TypeClassifiedCLFTransforms:
+    """
+    Return the cached classified *builtins* *CLF* transforms.
+
+    Returns
+    -------
+    :class:`dict`
+        Classified *builtins* *CLF* transforms, shared by every call and thus
+        not to be modified.
+
+    Notes
+    -----
+    -   The *builtins* *CLF* transforms are discovered and classified once for
+        the lifetime of the process, the cache can be cleared with the
+        ``cache_clear`` method, e.g., after changing the
+        :attr:`opencolorio_config_aces.clf.discover.classify.\
+ROOT_TRANSFORMS_CLF` attribute or regenerating the *CLF* transforms.
+    """
+
+    return classify_clf_transforms(discover_clf_transforms(ROOT_TRANSFORMS_CLF))
+
+
+def _classified_builtin_clf_transforms() -> TypeClassifiedCLFTransforms:
+    """
+    Return the classified *builtins* *CLF* transforms.
+
+    Returns
+    -------
+    :class:`dict`
+        Classified *builtins* *CLF* transforms.
+
+    Notes
+    -----
+    -   The *builtins* *CLF* transforms are discovered and classified once for
+        the lifetime of the process, see
+        :func:`opencolorio_config_aces.clf.discover.classify.\
+_cached_classified_builtin_clf_transforms` definition. A copy of the cached
+        classified *CLF* transforms is returned so that modifying it, or the
+        *CLF* transforms siblings, does not affect the subsequent calls.
+    """
 
-    filtered_clf_transforms = []
-    for clf_transform in clf_transforms:
-        included = True
-        for filterer in filterers:
-            included *= filterer(clf_transform)
+    return copy.deepcopy(_cached_classified_builtin_clf_transforms())
 
-        if included:
-            filtered_clf_transforms.append(clf_transform)
 
-    return filtered_clf_transforms
+def _iter_clf_taxonomy_lines(
+    genera: Mapping[str, Mapping[str, CLFTransform | CLFTransformPair]],
+) -> Iterator[str]:
+    """
+    Iterate over the taxonomy lines of given *CLF* transforms family genera.
+
+    Parameters
+    ----------
+    genera
+        *CLF* transforms family genera, i.e., a value of the mapping returned by
+        :func:`opencolorio_config_aces.classify_clf_transforms` definition.
+
+    Yields
+    ------
+    :class:`str`
+        Taxonomy line.
+    """
+
+    for genus, clf_transforms in genera.items():
+        yield f"[ {genus} ]"
+        for name, clf_transform in clf_transforms.items():
+            yield f"\t( {name} )"
+            if isinstance(clf_transform, CLFTransform):
+                yield f'\t\t"{clf_transform.source}" --> "{clf_transform.target}"'
+                clf_transform_id = clf_transform.clf_transform_id
+                if clf_transform_id is not None:
+                    yield f'\t\tCLFtransformID : "{clf_transform_id.clf_transform_id}"'
+            elif isinstance(clf_transform, CLFTransformPair):
+                forward_transform = clf_transform.forward_transform
+                yield (
+                    f'\t\t"{forward_transform.source}" <--> '
+                    f'"{forward_transform.target}"'
+                )
+                for transform in (forward_transform, clf_transform.inverse_transform):
+                    clf_transform_id = transform.clf_transform_id
+                    if clf_transform_id is not None:
+                        yield (
+                            f"\t\tCLFtransformID : "
+                            f'"{clf_transform_id.clf_transform_id}"'
+                        )
 
 
 def print_clf_taxonomy() -> None:
@@ -1278,41 +1732,19 @@ reference.ROOT_TRANSFORMS_CLF` attribute using the
     -   The resulting data structure is printed.
     """
 
-    classified_clf_transforms = classify_clf_transforms(discover_clf_transforms())
+    # NOTE: The taxonomy lines are formatted eagerly, nothing is done when they
+    # would not be emitted.
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    classified_clf_transforms = _classified_builtin_clf_transforms()
 
     for family, genera in classified_clf_transforms.items():
         message_box(family, print_callable=logger.info)
-        for genus, clf_transforms in genera.items():
-            logger.info("[ %s ]", genus)
-            for name, clf_transform in clf_transforms.items():
-                logger.info("\t( %s )", name)
-                if isinstance(clf_transform, CLFTransform):
-                    logger.info(
-                        '\t\t"%s" --> "%s"',
-                        clf_transform.source,
-                        clf_transform.target,
-                    )
-                    if clf_transform.clf_transform_id is not None:
-                        logger.info(
-                            '\t\tCLFtransformID : "%s"',
-                            clf_transform.clf_transform_id.clf_transform_id,
-                        )
-                elif isinstance(clf_transform, CLFTransformPair):
-                    logger.info(
-                        '\t\t"%s" <--> "%s"',
-                        clf_transform.forward_transform.source,
-                        clf_transform.forward_transform.target,
-                    )
-                    if clf_transform.forward_transform.clf_transform_id is not None:
-                        logger.info(
-                            '\t\tACEStransformID : "%s"',
-                            clf_transform.forward_transform.clf_transform_id.clf_transform_id,
-                        )
-                    if clf_transform.inverse_transform.clf_transform_id is not None:
-                        logger.info(
-                            '\t\tACEStransformID : "%s"',
-                            clf_transform.inverse_transform.clf_transform_id.clf_transform_id,
-                        )
+
+        # NOTE: The lines of a family are emitted as a single logging record to
+        # amortise the cost of the logging machinery.
+        logger.info("%s", "\n".join(_iter_clf_taxonomy_lines(genera)))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,256 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright Contributors to the OpenColorIO Project.
+"""
+Defines the unit tests for the
+:mod:`opencolorio_config_aces.clf.discover.classify` module.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from opencolorio_config_aces.clf.discover import classify
+from opencolorio_config_aces.clf.discover.classify import (
+    ROOT_TRANSFORMS_CLF,
+    classify_clf_transforms,
+    discover_clf_transforms,
+    filter_clf_transforms,
+    unclassify_clf_transforms,
+)
+
+__author__ = "OpenColorIO Contributors"
+__copyright__ = "Copyright Contributors to the OpenColorIO Project."
+__license__ = "New BSD License - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "OpenColorIO Contributors"
+__email__ = "ocio-dev@lists.aswf.io"
+__status__ = "Production"
+
+__all__ = [
+    "TestClassifyClfTransforms",
+    "TestFilterClfTransforms",
+    "TestClassifiedBuiltinClfTransforms",
+]
+
+
+class TestClassifyClfTransforms(unittest.TestCase):
+    """
+    Define :func:`opencolorio_config_aces.clf.discover.classify.\
+classify_clf_transforms` definition unit tests methods.
+    """
+
+    def test_classify_clf_transforms(self):
+        """
+        Test :func:`opencolorio_config_aces.clf.discover.classify.\
+classify_clf_transforms` definition.
+        """
+
+        clf_transforms = classify_clf_transforms(discover_clf_transforms())
+
+        self.assertIn("sony", clf_transforms)
+        self.assertIn("arri", clf_transforms)
+
+    def test_classify_clf_transforms_families(self):
+        """
+        Test :func:`opencolorio_config_aces.clf.discover.classify.\
+classify_clf_transforms` definition *families* argument.
+        """
+
+        unclassified_clf_transforms = discover_clf_transforms()
+        clf_transforms = classify_clf_transforms(unclassified_clf_transforms)
+
+        filtered_clf_transforms = classify_clf_transforms(
+            unclassified_clf_transforms, families={"sony", "arri"}
+        )
+
+        self.assertListEqual(sorted(filtered_clf_transforms), ["arri", "sony"])
+        self.assertDictEqual(filtered_clf_transforms["sony"], clf_transforms["sony"])
+        self.assertDictEqual(filtered_clf_transforms["arri"], clf_transforms["arri"])
+
+        self.assertDictEqual(
+            classify_clf_transforms(unclassified_clf_transforms, families=()), {}
+        )
+
+    def test_classify_clf_transforms_max_workers(self):
+        """
+        Test :func:`opencolorio_config_aces.clf.discover.classify.\
+classify_clf_transforms` definition *max_workers* argument.
+        """
+
+        unclassified_clf_transforms = discover_clf_transforms()
+
+        self.assertDictEqual(
+            classify_clf_transforms(unclassified_clf_transforms, max_workers=1),
+            classify_clf_transforms(unclassified_clf_transforms, max_workers=4),
+        )
+
+
+class TestFilterClfTransforms(unittest.TestCase):
+    """
+    Define :func:`opencolorio_config_aces.clf.discover.classify.\
+filter_clf_transforms` definition unit tests methods.
+    """
+
+    def setUp(self):
+        """Initialise the common tests attributes."""
+
+        self._clf_transforms = classify_clf_transforms(discover_clf_transforms())
+
+    def test_filter_clf_transforms(self):
+        """
+        Test :func:`opencolorio_config_aces.clf.discover.classify.\
+filter_clf_transforms` definition.
+        """
+
+        unclassified_clf_transforms = unclassify_clf_transforms(self._clf_transforms)
+
+        self.assertListEqual(
+            filter_clf_transforms(self._clf_transforms), unclassified_clf_transforms
+        )
+
+        filtered_clf_transforms = filter_clf_transforms(
+            self._clf_transforms,
+            [lambda x: x.family == "sony", lambda x: "SLog3" in x.path],
+        )
+
+        self.assertTrue(filtered_clf_transforms)
+        for clf_transform in filtered_clf_transforms:
+            self.assertEqual(clf_transform.family, "sony")
+            self.assertIn("SLog3", clf_transform.path)
+
+    def test_filter_clf_transforms_limit(self):
+        """
+        Test :func:`opencolorio_config_aces.clf.discover.classify.\
+filter_clf_transforms` definition *limit* argument.
+        """
+
+        filterers = [lambda x: x.family == "sony"]
+
+        filtered_clf_transforms = filter_clf_transforms(self._clf_transforms, filterers)
+
+        self.assertGreater(len(filtered_clf_transforms), 3)
+
+        self.assertListEqual(
+            filter_clf_transforms(self._clf_transforms, filterers, limit=3),
+            filtered_clf_transforms[:3],
+        )
+        self.assertListEqual(
+            filter_clf_transforms(self._clf_transforms, filterers, limit=0), []
+        )
+        self.assertListEqual(
+            filter_clf_transforms(self._clf_transforms, filterers, limit=1000),
+            filtered_clf_transforms,
+        )
+
+    def test_filter_clf_transforms_families(self):
+        """
+        Test :func:`opencolorio_config_aces.clf.discover.classify.\
+filter_clf_transforms` definition *families* argument.
+        """
+
+        families = {"sony", "arri"}
+
+        expected_clf_transforms = filter_clf_transforms(
+            self._clf_transforms, [lambda x: x.family in families]
+        )
+
+        self.assertTrue(expected_clf_transforms)
+        self.assertListEqual(
+            filter_clf_transforms(self._clf_transforms, families=families),
+            expected_clf_transforms,
+        )
+        self.assertListEqual(
+            filter_clf_transforms(
+                unclassify_clf_transforms(self._clf_transforms), families=families
+            ),
+            expected_clf_transforms,
+        )
+        self.assertListEqual(
+            filter_clf_transforms(self._clf_transforms, families=()), []
+        )
+
+
+class TestClassifiedBuiltinClfTransforms(unittest.TestCase):
+    """
+    Define :func:`opencolorio_config_aces.clf.discover.classify.\
+_classified_builtin_clf_transforms` definition unit tests methods.
+    """
+
+    def setUp(self):
+        """Initialise the common tests attributes."""
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+        self._root_directory = os.path.join(self._temporary_directory, "transforms")
+        for family in ("canon", "sony"):
+            shutil.copytree(
+                os.path.join(ROOT_TRANSFORMS_CLF, family),
+                os.path.join(self._root_directory, family),
+            )
+
+    def tearDown(self):
+        """After tests actions."""
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_classified_builtin_clf_transforms(self):
+        """
+        Test :func:`opencolorio_config_aces.clf.discover.classify.\
+_classified_builtin_clf_transforms` definition.
+        """
+
+        clf_transforms = classify._classified_builtin_clf_transforms()
+
+        self.assertDictEqual(
+            classify._classified_builtin_clf_transforms(), clf_transforms
+        )
+        self.assertIsNot(classify._classified_builtin_clf_transforms(), clf_transforms)
+
+        # The returned classified *CLF* transforms are copies that can be
+        # modified without affecting the subsequent calls.
+        clf_transform = clf_transforms["sony"]["Input"]["Sony.Input.SLog3-Curve"]
+        clf_transform.siblings.append(clf_transform)
+        del clf_transforms["arri"]
+
+        clf_transforms = classify._classified_builtin_clf_transforms()
+
+        self.assertIn("arri", clf_transforms)
+        self.assertListEqual(
+            clf_transforms["sony"]["Input"]["Sony.Input.SLog3-Curve"].siblings, []
+        )
+
+    def test_cached_classified_builtin_clf_transforms(self):
+        """
+        Test :func:`opencolorio_config_aces.clf.discover.classify.\
+_cached_classified_builtin_clf_transforms` definition.
+        """
+
+        clf_transforms = classify._cached_classified_builtin_clf_transforms()
+
+        self.assertIs(
+            classify._cached_classified_builtin_clf_transforms(), clf_transforms
+        )
+
+        try:
+            with mock.patch.object(
+                classify, "ROOT_TRANSFORMS_CLF", self._root_directory
+            ):
+                # The cache is kept for the lifetime of the process.
+                self.assertIs(
+                    classify._cached_classified_builtin_clf_transforms(),
+                    clf_transforms,
+                )
+
+                classify._cached_classified_builtin_clf_transforms.cache_clear()
+
+                self.assertListEqual(
+                    sorted(classify._cached_classified_builtin_clf_transforms()),
+                    ["canon", "sony"],
+                )
+        finally:
+            classify._cached_classified_builtin_clf_transforms.cache_clear()
+
+
+if __name__ == "__main__":
+    unittest.main()
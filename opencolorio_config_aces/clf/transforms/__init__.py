@@ -1,6 +1,10 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright Contributors to the OpenColorIO Project.
 
+import typing
+
+from opencolorio_config_aces.utilities import lazy_module_attributes
+
 from .utilities import (
     matrix_transform,
     matrix_RGB_to_RGB_transform,
@@ -9,31 +13,36 @@ from .utilities import (
     format_clf_transform_id,
     clf_basename,
 )
-from .arri import (
-    generate_clf_transforms_arri,
-)
-from .blackmagic import (
-    generate_clf_transforms_bmdfilm,
-    generate_clf_transforms_davinci,
-)
-from .canon import (
-    generate_clf_transforms_canon,
-)
-from .itu import (
-    generate_clf_transforms_itu,
-)
-from .ocio import (
-    generate_clf_transforms_ocio,
-)
-from .panasonic import (
-    generate_clf_transforms_panasonic,
-)
-from .red import (
-    generate_clf_transforms_red,
-)
-from .sony import (
-    generate_clf_transforms_sony,
-)
+
+if typing.TYPE_CHECKING:
+    from .apple import (
+        generate_clf_transforms_apple,
+    )
+    from .arri import (
+        generate_clf_transforms_arri,
+    )
+    from .blackmagic import (
+        generate_clf_transforms_bmdfilm,
+        generate_clf_transforms_davinci,
+    )
+    from .canon import (
+        generate_clf_transforms_canon,
+    )
+    from .itu import (
+        generate_clf_transforms_itu,
+    )
+    from .ocio import (
+        generate_clf_transforms_ocio,
+    )
+    from .panasonic import (
+        generate_clf_transforms_panasonic,
+    )
+    from .red import (
+        generate_clf_transforms_red,
+    )
+    from .sony import (
+        generate_clf_transforms_sony,
+    )
 
 __all__ = [
     "matrix_transform",
@@ -42,29 +51,35 @@ __all__ = [
     "generate_clf_transform",
     "format_clf_transform_id",
     "clf_basename",
-]
-__all__ += [
+    "generate_clf_transforms_apple",
     "generate_clf_transforms_arri",
-]
-__all__ += [
     "generate_clf_transforms_bmdfilm",
     "generate_clf_transforms_davinci",
-]
-__all__ += [
     "generate_clf_transforms_canon",
-]
-__all__ += [
     "generate_clf_transforms_itu",
-]
-__all__ += [
     "generate_clf_transforms_ocio",
-]
-__all__ += [
     "generate_clf_transforms_panasonic",
-]
-__all__ += [
     "generate_clf_transforms_red",
-]
-__all__ += [
     "generate_clf_transforms_sony",
 ]
+
+_LAZY_IMPORTS = {
+    "generate_clf_transforms_apple": ".apple",
+    "generate_clf_transforms_arri": ".arri",
+    "generate_clf_transforms_bmdfilm": ".blackmagic",
+    "generate_clf_transforms_davinci": ".blackmagic",
+    "generate_clf_transforms_canon": ".canon",
+    "generate_clf_transforms_itu": ".itu",
+    "generate_clf_transforms_ocio": ".ocio",
+    "generate_clf_transforms_panasonic": ".panasonic",
+    "generate_clf_transforms_red": ".red",
+    "generate_clf_transforms_sony": ".sony",
+}
+"""
+Mapping of the public objects to the sub-packages defining them, the objects
+are imported on first attribute access, see :pep:`562`.
+
+_LAZY_IMPORTS : dict
+"""
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, _LAZY_IMPORTS)
@@ -10,9 +10,10 @@ transforms:
 -   :func:`opencolorio_config_aces.clf.generate_clf_transforms_arri`
 """
 
+import functools
 import logging
 import sys
-from math import log, log10
+from math import log, log2, log10
 from pathlib import Path
 
 import PyOpenColorIO as ocio
@@ -57,6 +58,49 @@ VERSION = "1.0"
 *CLF* transforms version.
 """
 
+_LOGC4_A = (2.0**18.0 - 16.0) / 117.45
+"""
+*ARRI LogC4* curve :math:`a` parameter as given by the
+*ARRI LogC4 Logarithmic Color Space Specification*.
+"""
+
+_LOGC4_B = (1023.0 - 95.0) / 1023.0
+"""
+*ARRI LogC4* curve :math:`b` parameter as given by the
+*ARRI LogC4 Logarithmic Color Space Specification*.
+"""
+
+_LOGC4_C = 95.0 / 1023.0
+"""
+*ARRI LogC4* curve :math:`c` parameter as given by the
+*ARRI LogC4 Logarithmic Color Space Specification*.
+"""
+
+_LOGC4_T = (pow(2.0, 14.0 * (-_LOGC4_C / _LOGC4_B) + 6.0) - 64.0) / _LOGC4_A
+"""
+*ARRI LogC4* curve :math:`t` parameter, i.e., the linear break point, as given
+by the *ARRI LogC4 Logarithmic Color Space Specification*.
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _awg3_matrix():
+    """
+    Derive the matrix for ARRI Wide Gamut 3 primaries.
+
+    Returns
+    -------
+    tuple
+        Immutable 4x4 matrix, flattened, as expected by *OpenColorIO*
+        `MatrixTransform`.
+    """
+
+    return tuple(
+        matrix_RGB_to_RGB_transform(
+            "ALEXA Wide Gamut", "ACES2065-1", "CAT02"
+        ).getMatrix()
+    )
+
 
 def _build_awg3_mtx():
     """
@@ -71,37 +115,25 @@ def _build_awg3_mtx():
          *OpenColorIO* `MatrixTransform`.
     """
 
-    mtx = matrix_RGB_to_RGB_transform("ALEXA Wide Gamut", "ACES2065-1", "CAT02")
-    return mtx
+    return transform_factory(transform_type="MatrixTransform", matrix=_awg3_matrix())
 
 
-def _build_logc3_curve(ei=800, info=False):
+@functools.lru_cache(maxsize=1024)
+def _logc3_curve_parameters(ei):
     """
-    Build the `LogCameraTransform` for ARRI LogC3 Curve.
-
-    Parameter values are derived from the published aces-dev IDT formula.
+    Derive the ARRI LogC3 Curve parameters for given *Exposure Index*.
 
     Parameters
     ----------
-    ei : int, optional
-        *Exposure Index* of the LogC3 Curve to generate.
-    info : bool, optional
-        Whether to print additional informative text.
+    ei : int
+        *Exposure Index* of the LogC3 Curve.
 
     Returns
     -------
-    ocio.LogCameraTransform
-         *OpenColorIO* `LogCameraTransform`.
-
-    Raises
-    ------
-    ValueError
-        If `ei` is not in the supported range.
+    tuple
+        *CLF* `cameraLogToLin` parameters :math:`(cut, a, b, c, d)`.
     """
 
-    if not (160 <= ei <= 1280):
-        raise ValueError(f"Unsupported EI{ei:d} requested, must be 160 <= EI <= 1280")
-
     # v3_IDT_maker.py parameters
     nominalEI = 400
     midGraySignal = 0.01
@@ -112,7 +144,7 @@ def _build_logc3_curve(ei=800, info=False):
     offset = log10(cutPoint) - slope * cutPoint
     gain = ei / nominalEI
     gray = midGraySignal / gain
-    encGain = (log(gain) / log(2) * (0.89 - 1) / 3 + 1) * encodingGain
+    encGain = (log2(gain) * (0.89 - 1) / 3 + 1) * encodingGain
     encOffset = encodingOffset
 
     for _ in range(3):
@@ -127,6 +159,38 @@ def _build_logc3_curve(ei=800, info=False):
     c = encGain
     d = encOffset
 
+    return cut, a, b, c, d
+
+
+def _build_logc3_curve(ei=800, info=False):
+    """
+    Build the `LogCameraTransform` for ARRI LogC3 Curve.
+
+    Parameter values are derived from the published aces-dev IDT formula.
+
+    Parameters
+    ----------
+    ei : int, optional
+        *Exposure Index* of the LogC3 Curve to generate.
+    info : bool, optional
+        Whether to print additional informative text.
+
+    Returns
+    -------
+    ocio.LogCameraTransform
+         *OpenColorIO* `LogCameraTransform`.
+
+    Raises
+    ------
+    ValueError
+        If `ei` is not in the supported range.
+    """
+
+    if not (160 <= ei <= 1280):
+        raise ValueError(f"Unsupported EI{ei:d} requested, must be 160 <= EI <= 1280")
+
+    cut, a, b, c, d = _logc3_curve_parameters(ei)
+
     # print informative text if requested
     if info:
         # compute unused variables for completeness
@@ -216,12 +280,7 @@ def _build_logc4_curve():
          *OpenColorIO* `LogCameraTransform`.
     """
 
-    # Parameters as defined in "ARRI LogC4 Logarithmic Color Space Specification"
-    # Parameters as defined in aces-dev CTL
-    a = (2.0**18.0 - 16.0) / 117.45
-    b = (1023.0 - 95.0) / 1023.0
-    c = 95.0 / 1023.0
-    t = (pow(2.0, 14.0 * (-c / b) + 6.0) - 64.0) / a
+    a, b, c, t = _LOGC4_A, _LOGC4_B, _LOGC4_C, _LOGC4_T
 
     # OCIO LogCameraTransform translation variables
     linSideSlope = [a] * 3
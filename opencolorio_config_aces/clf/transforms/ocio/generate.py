@@ -56,8 +56,6 @@ VERSION = "1.0"
 def generate_clf_transforms_ocio(output_directory):
     """Generate OCIO Utility CLF transforms."""
 
-    import colour
-
     output_directory.mkdir(parents=True, exist_ok=True)
 
     clf_transforms = {}
@@ -103,6 +101,11 @@ def generate_clf_transforms_ocio(output_directory):
     name = "AP0_to_CIE_XYZ-D65-Scene-referred"
     clf_transform_id = format_clf_transform_id(FAMILY, GENUS, name, VERSION)
     filename = output_directory / clf_basename(clf_transform_id)
+
+    # NOTE: *Colour* is only imported when the first transform requiring it is
+    # generated, the curves before are produced with *OpenColorIO* only.
+    import colour
+
     M_ACES = colour.RGB_COLOURSPACES["ACES2065-1"].matrix_RGB_to_XYZ
     XYZ_ACES = colour.xy_to_XYZ(colour.RGB_COLOURSPACES["ACES2065-1"].whitepoint)
     XYZ_D65 = colour.xy_to_XYZ(
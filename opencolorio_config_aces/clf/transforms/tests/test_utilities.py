@@ -0,0 +1,121 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright Contributors to the OpenColorIO Project.
+"""
+Defines the unit tests for the
+:mod:`opencolorio_config_aces.clf.transforms.utilities` module.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import PyOpenColorIO as ocio
+
+from opencolorio_config_aces.clf.transforms import (
+    gamma_transform,
+    generate_clf_transform,
+)
+
+__author__ = "OpenColorIO Contributors"
+__copyright__ = "Copyright Contributors to the OpenColorIO Project."
+__license__ = "New BSD License - https://opensource.org/licenses/BSD-3-Clause"
+__maintainer__ = "OpenColorIO Contributors"
+__email__ = "ocio-dev@lists.aswf.io"
+__status__ = "Production"
+
+__all__ = [
+    "TestGenerateClfTransform",
+]
+
+
+class TestGenerateClfTransform(unittest.TestCase):
+    """
+    Define :func:`opencolorio_config_aces.clf.transforms.utilities.\
+generate_clf_transform` definition unit tests methods.
+    """
+
+    def setUp(self):
+        """Initialise the common tests attributes."""
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+        self._filename = os.path.join(self._temporary_directory, "Gamma.clf")
+
+    def tearDown(self):
+        """After tests actions."""
+
+        shutil.rmtree(self._temporary_directory)
+
+    def _generate_clf_transform(self, gamma=2.4):
+        """Generate a *CLF* transform with given gamma."""
+
+        return generate_clf_transform(
+            self._filename,
+            [gamma_transform(gamma)],
+            "urn:aswf:ocio:transformId:1.0:OCIO:Utility:Gamma:1.0",
+            "Gamma",
+            "Linear",
+            "Gamma",
+        )
+
+    def test_generate_clf_transform(self):
+        """
+        Test :func:`opencolorio_config_aces.clf.transforms.utilities.\
+generate_clf_transform` definition.
+        """
+
+        group_transform = self._generate_clf_transform()
+
+        filename = os.path.join(self._temporary_directory, "Reference.clf")
+        group_transform.write(
+            formatName="Academy/ASC Common LUT Format",
+            config=ocio.Config.CreateRaw(),
+            fileName=filename,
+        )
+
+        with open(self._filename, "rb") as clf_file, open(
+            filename, "rb"
+        ) as reference_file:
+            self.assertEqual(clf_file.read(), reference_file.read())
+
+    def test_generate_clf_transform_unchanged(self):
+        """
+        Test :func:`opencolorio_config_aces.clf.transforms.utilities.\
+generate_clf_transform` definition does not rewrite an up-to-date file.
+        """
+
+        self._generate_clf_transform()
+
+        os.utime(self._filename, ns=(0, 0))
+
+        self._generate_clf_transform()
+
+        self.assertEqual(os.stat(self._filename).st_mtime_ns, 0)
+
+    def test_generate_clf_transform_changed(self):
+        """
+        Test :func:`opencolorio_config_aces.clf.transforms.utilities.\
+generate_clf_transform` definition rewrites an outdated file.
+        """
+
+        self._generate_clf_transform(2.2)
+
+        with open(self._filename, "rb") as clf_file:
+            outdated_clf = clf_file.read()
+
+        os.utime(self._filename, ns=(0, 0))
+
+        self._generate_clf_transform(2.4)
+
+        self.assertNotEqual(os.stat(self._filename).st_mtime_ns, 0)
+
+        with open(self._filename, "rb") as clf_file:
+            clf = clf_file.read()
+
+        self.assertNotEqual(clf, outdated_clf)
+        self.assertIn(b'exponent="2.4"', clf)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,7 +8,9 @@ Defines various utility functions for generating *Common LUT Format*
 (CLF) transforms.
 """
 
+import functools
 import logging
+import os
 import re
 
 import PyOpenColorIO as ocio
@@ -39,6 +41,16 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 
+_PATTERN_LINEAR_SOURCE_CLF: re.Pattern = re.compile(r"\.Linear_to_")
+"""
+Compiled pattern matching a *Linear* source in a *CLF* transform stem.
+"""
+
+_PATTERN_LINEAR_TARGET_CLF: re.Pattern = re.compile("_to_Linear$")
+"""
+Compiled pattern matching a *Linear* target in a *CLF* transform stem.
+"""
+
 
 @required("Colour")
 def matrix_transform(matrix, offset=None):
@@ -60,19 +72,17 @@ def matrix_transform(matrix, offset=None):
 
     import numpy as np
 
-    matrix44 = np.zeros((4, 4))
-    matrix44[3, 3] = 1.0
-    for i in range(3):
-        matrix44[i, 0:3] = matrix[i, :]
+    matrix44 = np.identity(4)
+    matrix44[:3, :3] = matrix
 
     offset4 = np.zeros(4)
     if offset is not None:
-        offset4[0:3] = offset
+        offset4[:3] = offset
 
     return transform_factory(
         transform_type="MatrixTransform",
-        matrix=list(matrix44.ravel()),
-        offset=list(offset4),
+        matrix=matrix44.ravel().tolist(),
+        offset=offset4.tolist(),
     )
 
 
@@ -243,17 +253,33 @@ def generate_clf_transform(
         if style:
             info.addChildElement("BuiltinTransform", style)
 
-    logger.info('Writing "%s" "CLF" transform to "%s".', clf_transform_id, filename)
-
-    group_tf.write(
+    clf = group_tf.write(
         formatName="Academy/ASC Common LUT Format",
         config=ocio.Config.CreateRaw(),
-        fileName=str(filename),
     )
 
+    # NOTE: Leaving unchanged files untouched preserves their modification time
+    # so that downstream build steps do not consider them stale.
+    if os.path.isfile(filename):
+        with open(filename, encoding="utf-8", newline="") as clf_file:
+            if clf_file.read() == clf:
+                logger.info(
+                    'Skipping "%s" "CLF" transform, "%s" is up-to-date.',
+                    clf_transform_id,
+                    filename,
+                )
+
+                return group_tf
+
+    logger.info('Writing "%s" "CLF" transform to "%s".', clf_transform_id, filename)
+
+    with open(filename, "w", encoding="utf-8", newline="") as clf_file:
+        clf_file.write(clf)
+
     return group_tf
 
 
+@functools.lru_cache(maxsize=1024)
 def format_clf_transform_id(family, genus, name, version):
     """
     Format given *CLF* transform attributes to produce a *CLFtransformID*.
@@ -283,6 +309,7 @@ def format_clf_transform_id(family, genus, name, version):
     return SEPARATOR_ID_CLF.join([URN_CLF, family, genus, name, version])
 
 
+@functools.lru_cache(maxsize=1024)
 def clf_basename(clf_transform_id):
     """
     Generate a *CLF* basename from given *CLFtransformID*.
@@ -309,7 +336,7 @@ def clf_basename(clf_transform_id):
     )
 
     stem = ".".join(tokens[:-1])
-    stem = re.sub(r"\.Linear_to_", ".", stem)
-    stem = re.sub("_to_Linear$", "", stem)
+    stem = _PATTERN_LINEAR_SOURCE_CLF.sub(".", stem)
+    stem = _PATTERN_LINEAR_TARGET_CLF.sub("", stem)
 
     return f"{stem}{EXTENSION_CLF}"
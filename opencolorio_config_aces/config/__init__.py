@@ -1,49 +1,54 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright Contributors to the OpenColorIO Project.
 
-from .generation import (
-    TRANSFORM_FACTORIES,
-    colorspace_factory,
-    group_transform_factory,
-    look_factory,
-    named_transform_factory,
-    produce_transform,
-    transform_factory,
-    view_transform_factory,
-)
-from .generation import (
-    BUILTIN_TRANSFORMS,
-    DEPENDENCY_VERSIONS,
-    ConfigData,
-    PROFILE_VERSION_DEFAULT,
-    PROFILE_VERSIONS,
-    DependencyVersions,
-    deserialize_config_data,
-    generate_config,
-    serialize_config_data,
-    validate_config,
-)
-from .reference import (
-    build_aces_conversion_graph,
-    classify_aces_ctl_transforms,
-    conversion_path,
-    ctl_transform_to_node,
-    discover_aces_ctl_transforms,
-    filter_ctl_transforms,
-    filter_nodes,
-    generate_amf_components,
-    node_to_ctl_transform,
-    plot_aces_conversion_graph,
-    print_aces_taxonomy,
-    unclassify_ctl_transforms,
-    version_aces_dev,
-)
-from .reference import (
-    DescriptionStyle,
-    generate_config_aces,
-)
-from .cg import generate_config_cg
-from .studio import generate_config_studio
+import typing
+
+from opencolorio_config_aces.utilities import lazy_module_attributes
+
+if typing.TYPE_CHECKING:
+    from .generation import (
+        TRANSFORM_FACTORIES,
+        colorspace_factory,
+        group_transform_factory,
+        look_factory,
+        named_transform_factory,
+        produce_transform,
+        transform_factory,
+        view_transform_factory,
+        BUILTIN_TRANSFORMS,
+        DEPENDENCY_VERSIONS,
+        ConfigData,
+        PROFILE_VERSION_DEFAULT,
+        PROFILE_VERSIONS,
+        DependencyVersions,
+        deserialize_config_data,
+        generate_config,
+        serialize_config_data,
+        validate_config,
+    )
+    from .reference import (
+        build_aces_conversion_graph,
+        classify_aces_ctl_transforms,
+        conversion_path,
+        ctl_transform_to_node,
+        discover_aces_ctl_transforms,
+        filter_ctl_transforms,
+        filter_nodes,
+        generate_amf_components,
+        node_to_ctl_transform,
+        plot_aces_conversion_graph,
+        print_aces_taxonomy,
+        unclassify_ctl_transforms,
+        version_aces_dev,
+        DescriptionStyle,
+        generate_config_aces,
+    )
+    from .cg import (
+        generate_config_cg,
+    )
+    from .studio import (
+        generate_config_studio,
+    )
 
 __all__ = [
     "TRANSFORM_FACTORIES",
@@ -54,8 +59,6 @@ __all__ = [
     "produce_transform",
     "transform_factory",
     "view_transform_factory",
-]
-__all__ += [
     "BUILTIN_TRANSFORMS",
     "DEPENDENCY_VERSIONS",
     "ConfigData",
@@ -66,8 +69,6 @@ __all__ += [
     "generate_config",
     "serialize_config_data",
     "validate_config",
-]
-__all__ += [
     "build_aces_conversion_graph",
     "classify_aces_ctl_transforms",
     "conversion_path",
@@ -81,10 +82,54 @@ __all__ += [
     "print_aces_taxonomy",
     "unclassify_ctl_transforms",
     "version_aces_dev",
-]
-__all__ += [
     "DescriptionStyle",
     "generate_config_aces",
+    "generate_config_cg",
+    "generate_config_studio",
 ]
-__all__ += ["generate_config_cg"]
-__all__ += ["generate_config_studio"]
+
+_LAZY_IMPORTS = {
+    "TRANSFORM_FACTORIES": ".generation",
+    "colorspace_factory": ".generation",
+    "group_transform_factory": ".generation",
+    "look_factory": ".generation",
+    "named_transform_factory": ".generation",
+    "produce_transform": ".generation",
+    "transform_factory": ".generation",
+    "view_transform_factory": ".generation",
+    "BUILTIN_TRANSFORMS": ".generation",
+    "DEPENDENCY_VERSIONS": ".generation",
+    "ConfigData": ".generation",
+    "PROFILE_VERSION_DEFAULT": ".generation",
+    "PROFILE_VERSIONS": ".generation",
+    "DependencyVersions": ".generation",
+    "deserialize_config_data": ".generation",
+    "generate_config": ".generation",
+    "serialize_config_data": ".generation",
+    "validate_config": ".generation",
+    "build_aces_conversion_graph": ".reference",
+    "classify_aces_ctl_transforms": ".reference",
+    "conversion_path": ".reference",
+    "ctl_transform_to_node": ".reference",
+    "discover_aces_ctl_transforms": ".reference",
+    "filter_ctl_transforms": ".reference",
+    "filter_nodes": ".reference",
+    "generate_amf_components": ".reference",
+    "node_to_ctl_transform": ".reference",
+    "plot_aces_conversion_graph": ".reference",
+    "print_aces_taxonomy": ".reference",
+    "unclassify_ctl_transforms": ".reference",
+    "version_aces_dev": ".reference",
+    "DescriptionStyle": ".reference",
+    "generate_config_aces": ".reference",
+    "generate_config_cg": ".cg",
+    "generate_config_studio": ".studio",
+}
+"""
+Mapping of the public objects to the sub-packages defining them, the objects
+are imported on first attribute access, see :pep:`562`.
+
+_LAZY_IMPORTS : dict
+"""
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, _LAZY_IMPORTS)
@@ -18,11 +18,6 @@ from pathlib import Path
 
 import PyOpenColorIO as ocio
 
-from opencolorio_config_aces.clf import (
-    classify_clf_transforms,
-    discover_clf_transforms,
-    unclassify_clf_transforms,
-)
 from opencolorio_config_aces.config.generation import (
     BUILTIN_TRANSFORMS,
     DEPENDENCY_VERSIONS,
@@ -814,6 +809,12 @@ def generate_config_cg(
         *CTL* transforms, *CLF* transforms and *ACES* *AMF* components.
     """
 
+    from opencolorio_config_aces.clf import (
+        classify_clf_transforms,
+        discover_clf_transforms,
+        unclassify_clf_transforms,
+    )
+
     scheme = validate_method(scheme, ["Legacy", "Modern 1"])
 
     logger.info(
@@ -49,8 +49,6 @@ __all__ = [
     "PROFILE_VERSIONS",
     "DependencyVersions",
     "DEPENDENCY_VERSIONS",
-]
-__all__ += [
     "SEPARATOR_COLORSPACE_NAME",
     "SEPARATOR_COLORSPACE_FAMILY",
     "SEPARATOR_BUILTIN_TRANSFORM_NAME",
@@ -67,8 +65,6 @@ __all__ += [
     "beautify_view_transform_name",
     "beautify_display_name",
     "beautify_alias",
-]
-__all__ += [
     "BUILTIN_TRANSFORMS",
     "group_transform_factory",
     "colorspace_factory",
@@ -78,8 +74,6 @@ __all__ += [
     "TRANSFORM_FACTORIES",
     "transform_factory",
     "produce_transform",
-]
-__all__ += [
     "ConfigData",
     "deserialize_config_data",
     "serialize_config_data",
@@ -1,25 +1,30 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright Contributors to the OpenColorIO Project.
 
-from .discover import (
-    version_aces_dev,
-    discover_aces_ctl_transforms,
-    classify_aces_ctl_transforms,
-    unclassify_ctl_transforms,
-    filter_ctl_transforms,
-    generate_amf_components,
-    print_aces_taxonomy,
-    build_aces_conversion_graph,
-    node_to_ctl_transform,
-    ctl_transform_to_node,
-    filter_nodes,
-    conversion_path,
-    plot_aces_conversion_graph,
-)
-from .generate import (
-    DescriptionStyle,
-    generate_config_aces,
-)
+import typing
+
+from opencolorio_config_aces.utilities import lazy_module_attributes
+
+if typing.TYPE_CHECKING:
+    from .discover import (
+        version_aces_dev,
+        discover_aces_ctl_transforms,
+        classify_aces_ctl_transforms,
+        unclassify_ctl_transforms,
+        filter_ctl_transforms,
+        generate_amf_components,
+        print_aces_taxonomy,
+        build_aces_conversion_graph,
+        node_to_ctl_transform,
+        ctl_transform_to_node,
+        filter_nodes,
+        conversion_path,
+        plot_aces_conversion_graph,
+    )
+    from .generate import (
+        DescriptionStyle,
+        generate_config_aces,
+    )
 
 __all__ = [
     "version_aces_dev",
@@ -35,8 +40,32 @@ __all__ = [
     "filter_nodes",
     "conversion_path",
     "plot_aces_conversion_graph",
-]
-__all__ += [
     "DescriptionStyle",
     "generate_config_aces",
 ]
+
+_LAZY_IMPORTS = {
+    "version_aces_dev": ".discover",
+    "discover_aces_ctl_transforms": ".discover",
+    "classify_aces_ctl_transforms": ".discover",
+    "unclassify_ctl_transforms": ".discover",
+    "filter_ctl_transforms": ".discover",
+    "generate_amf_components": ".discover",
+    "print_aces_taxonomy": ".discover",
+    "build_aces_conversion_graph": ".discover",
+    "node_to_ctl_transform": ".discover",
+    "ctl_transform_to_node": ".discover",
+    "filter_nodes": ".discover",
+    "conversion_path": ".discover",
+    "plot_aces_conversion_graph": ".discover",
+    "DescriptionStyle": ".generate",
+    "generate_config_aces": ".generate",
+}
+"""
+Mapping of the public objects to the sub-packages defining them, the objects
+are imported on first attribute access, see :pep:`562`.
+
+_LAZY_IMPORTS : dict
+"""
+
+__getattr__, __dir__ = lazy_module_attributes(__name__, _LAZY_IMPORTS)
@@ -27,8 +27,6 @@ __all__ = [
     "filter_ctl_transforms",
     "generate_amf_components",
     "print_aces_taxonomy",
-]
-__all__ += [
     "build_aces_conversion_graph",
     "node_to_ctl_transform",
     "ctl_transform_to_node",
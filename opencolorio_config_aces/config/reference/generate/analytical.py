@@ -115,7 +115,7 @@ def create_builtin_transform(style, profile_version=PROFILE_VERSION_DEFAULT):
     ----------
     style : unicode
         *OpenColorIO* builtin transform style.
-    profile_version : ProfileVersion, optional
+    profile_version : :class:`semver.Version`, optional
         *OpenColorIO* config profile version.
 
     Returns
@@ -166,7 +166,7 @@ def node_to_builtin_transform(
         *aces-dev* conversion graph.
     node : unicode
         Node name to generate the *OpenColorIO* builtin transform for.
-    profile_version : ProfileVersion, optional
+    profile_version : :class:`semver.Version`, optional
         *OpenColorIO* config profile version.
     direction : unicode, optional
         {'Forward', 'Reverse'},
@@ -239,7 +239,7 @@ def node_to_colorspace(
         *aces-dev* conversion graph.
     node : unicode
         Node name to generate the *OpenColorIO* `Colorspace` for.
-    profile_version : ProfileVersion, optional
+    profile_version : :class:`semver.Version`, optional
         *OpenColorIO* config profile version.
     describe : int, optional
         Any value from the
@@ -9,10 +9,12 @@ Defines common utilities objects that don't fall in any specific category.
 
 import datetime
 import functools
+import importlib
 import logging
 import os
 import re
 import subprocess
+import sys
 import unicodedata
 from collections import defaultdict
 from html.parser import HTMLParser
@@ -21,8 +23,6 @@ from pathlib import Path
 from pprint import PrettyPrinter
 from textwrap import TextWrapper
 
-import requests
-
 __author__ = "OpenColorIO Contributors"
 __copyright__ = "Copyright Contributors to the OpenColorIO Project."
 __license__ = "New BSD License - https://opensource.org/licenses/BSD-3-Clause"
@@ -54,6 +54,7 @@ __all__ = [
     "slugify",
     "attest",
     "timestamp",
+    "lazy_module_attributes",
 ]
 
 logger = logging.getLogger(__name__)
@@ -666,6 +667,10 @@ def google_sheet_title(url):
     if "export" in url:
         url = url.split("export")[0]
 
+    # NOTE: "requests" is imported here as it is slow to import and only needed
+    # to retrieve the sheet.
+    import requests
+
     parser = Parser()
     parser.feed(requests.get(url, timeout=60).text)
 
@@ -754,3 +759,63 @@ def timestamp():
     )
 
     return timestamp
+
+
+def lazy_module_attributes(module_name, attributes):
+    """
+    Return the :pep:`562` module level ``__getattr__`` and ``__dir__``
+    definitions importing given attributes from their defining sub-modules on
+    first access.
+
+    Parameters
+    ----------
+    module_name : str
+        Name of the module defining the attributes, i.e., its ``__name__``,
+        the sub-modules are imported relatively to it.
+    attributes : dict
+        Mapping of the attribute names to the relative names of the sub-modules
+        defining them.
+
+    Returns
+    -------
+    tuple
+        Module level ``__getattr__`` and ``__dir__`` definitions.
+
+    Examples
+    --------
+    >>> module_getattr, module_dir = lazy_module_attributes(
+    ...     "opencolorio_config_aces.utilities", {"slugify": ".common"}
+    ... )
+    >>> module_getattr("slugify")  # doctest: +ELLIPSIS
+    <function slugify at 0x...>
+    >>> "slugify" in module_dir()
+    True
+    >>> module_getattr("undefined")
+    Traceback (most recent call last):
+      ...
+    AttributeError: module 'opencolorio_config_aces.utilities' has no \
+attribute 'undefined'
+    """
+
+    def module_getattr(name):
+        """Import and return given attribute from its defining sub-module."""
+
+        submodule_name = attributes.get(name)
+
+        if submodule_name is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(submodule_name, module_name), name)
+
+        # NOTE: The attribute is stored on the module so that the subsequent
+        # accesses do not go through "__getattr__".
+        setattr(sys.modules[module_name], name, value)
+
+        return value
+
+    def module_dir():
+        """Return the module attributes, including the lazy attributes."""
+
+        return sorted({*vars(sys.modules[module_name]), *attributes})
+
+    return module_getattr, module_dir
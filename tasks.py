@@ -10,10 +10,11 @@ from __future__ import annotations
 import contextlib
 import inspect
 import os
+import sys
 from pathlib import Path
 
 import requests
-from invoke.exceptions import Failure
+from invoke.exceptions import Exit, Failure
 
 import opencolorio_config_aces
 from opencolorio_config_aces.config.cg.generate.config import (
@@ -54,6 +55,7 @@ __all__ = [
     "tests",
     "preflight",
     "docs",
+    "update_intersphinx_inventory",
     "build_clf_transforms",
     "build_aces_conversion_graph",
     "build_config_common_tests",
@@ -126,7 +128,7 @@ def clean(
 
     if docs:
         patterns.append("docs/_build")
-        patterns.append("docs/generated")
+        patterns.append("docs/autoapi")
 
     if bytecode:
         patterns.append("**/__pycache__")
@@ -239,6 +241,28 @@ def docs(ctx: Context, html: bool = True, pdf: bool = True):
             ctx.run("make latexpdf")
 
 
+@task
+def update_intersphinx_inventory(ctx: Context):  # noqa: ARG001
+    """
+    Generate the *Python* *Intersphinx* inventory used by the documentation.
+
+    Parameters
+    ----------
+    ctx
+        Context.
+    """
+
+    message_box('Updating the "Python" "Intersphinx" inventory...')
+
+    directory = Path("docs/_intersphinx").absolute()
+    directory.mkdir(parents=True, exist_ok=True)
+
+    with open(directory / "python-objects.inv", "wb") as inventory_file:
+        inventory_file.write(
+            requests.get("https://docs.python.org/3.9/objects.inv", timeout=60).content
+        )
+
+
 @task
 def build_clf_transforms(ctx: Context):
     """
@@ -251,6 +275,12 @@ def build_clf_transforms(ctx: Context):
     """
 
     message_box('Building the "CLF" transform files...')
+
+    # NOTE: The families write their "CLF" transforms in distinct directories,
+    # they are thus built concurrently. Their output is captured and printed
+    # sequentially once every build has completed, the failures are reported
+    # together afterwards.
+    promises = {}
     for family in [
         "apple",
         "arri",
@@ -263,7 +293,27 @@ def build_clf_transforms(ctx: Context):
         "sony",
     ]:
         with ctx.cd(f"opencolorio_config_aces/clf/transforms/{family}"):
-            ctx.run("python generate.py")
+            promises[family] = ctx.run(
+                "python generate.py", asynchronous=True, warn=True, hide=True
+            )
+
+    failures = []
+    for family, promise in promises.items():
+        result = promise.join()
+
+        message_box(f'"{family}" "CLF" transform files:')
+        sys.stdout.write(result.stdout)
+        sys.stderr.write(result.stderr)
+
+        if not result.ok:
+            failures.append(family)
+
+    if failures:
+        raise Exit(
+            f'Building the "CLF" transform files failed for the following '
+            f'families: {", ".join(failures)}',
+            code=1,
+        )
 
 
 @task